@@ -5,15 +5,12 @@ This example demonstrates the fundamental way to use the Anthropic API
 to send messages and receive responses from Claude.
 """
 
-from anthropic import Anthropic
-import os
-
 # Initialize the client
-# API key can be set via environment variable ANTHROPIC_API_KEY
-# or passed directly to the constructor
-client = Anthropic(
-    api_key=os.environ.get("ANTHROPIC_API_KEY", "your-api-key-here")
-)
+# API key is read from the ANTHROPIC_API_KEY environment variable;
+# the lazy singleton shares one connection pool across all examples
+from _client import get_client
+
+client = get_client()
 
 def basic_message():
     """Send a basic message to Claude"""
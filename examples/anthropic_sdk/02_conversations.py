@@ -5,35 +5,91 @@ This example demonstrates how to maintain conversation history
 and have back-and-forth interactions with Claude.
 """
 
-from anthropic import Anthropic
-import os
+from collections import deque
+import threading
 
-client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY", "your-api-key-here"))
+from _client import get_client
+
+client = get_client()
 
 
 class ConversationManager:
-    """Helper class to manage conversation history"""
+    """Helper class to manage conversation history
+
+    History is kept in a bounded ring buffer with a parallel token-count
+    sidecar. Without a bound, every turn re-sends the entire history, so
+    tokens sent grow quadratically over a long conversation. Old turns
+    are evicted once the buffer is full or the token budget is exceeded.
+    """
 
-    def __init__(self, model="claude-opus-4-1-20250805", system_prompt=None):
+    def __init__(self, model="claude-opus-4-1-20250805", system_prompt=None,
+                 max_turns=32, token_budget=8000, prefetch=False):
         self.model = model
         self.system_prompt = system_prompt
-        self.messages = []
+        self.token_budget = token_budget
+        self.prefetch = prefetch
+        self.messages = deque(maxlen=max_turns)
+        self.token_counts = deque(maxlen=max_turns)
+        self._prefetched = {}  # normalized follow-up question -> answer
+
+    @staticmethod
+    def _estimate_tokens(content):
+        """Local token count for messages without reported usage
+
+        Older SDKs ship an offline tokenizer (client.count_tokens); in
+        anthropic>=0.39 counting is a network endpoint, so fall back to
+        a chars/4 heuristic rather than pay a round-trip just to
+        maintain the trimming budget.
+        """
+        count_tokens = getattr(client, "count_tokens", None)
+        if callable(count_tokens):
+            try:
+                return count_tokens(str(content))
+            except TypeError:
+                pass
+        return len(str(content)) // 4 + 1
 
     def add_user_message(self, content):
         """Add a user message to the conversation"""
         self.messages.append({"role": "user", "content": content})
+        self.token_counts.append(self._estimate_tokens(content))
 
-    def add_assistant_message(self, content):
+    def add_assistant_message(self, content, token_count=None):
         """Add an assistant message to the conversation"""
         self.messages.append({"role": "assistant", "content": content})
+        self.token_counts.append(token_count or self._estimate_tokens(content))
+
+    def _trim_to_budget(self):
+        """Evict oldest turns until history fits the token budget"""
+        while len(self.messages) > 1 and sum(self.token_counts) > self.token_budget:
+            self.messages.popleft()
+            self.token_counts.popleft()
+
+        # The API requires the history to start with a user message
+        while self.messages and self.messages[0]["role"] != "user":
+            self.messages.popleft()
+            self.token_counts.popleft()
 
     def get_response(self, max_tokens=1000, temperature=1.0):
         """Get Claude's response and add it to the conversation"""
+        # Serve a speculatively prefetched answer if the user asked one
+        # of the predicted follow-ups (no API call at all)
+        if self.messages and self.messages[-1]["role"] == "user":
+            answer = self._prefetched.pop(
+                str(self.messages[-1]["content"]).strip().lower(), None)
+            if answer is not None:
+                self.add_assistant_message(answer)
+                if self.prefetch:
+                    self._spawn_prefetch()
+                return answer, None
+
+        self._trim_to_budget()
+
         kwargs = {
             "model": self.model,
             "max_tokens": max_tokens,
             "temperature": temperature,
-            "messages": self.messages
+            "messages": list(self.messages)
         }
 
         if self.system_prompt:
@@ -44,14 +100,91 @@ class ConversationManager:
         # Extract the text response
         assistant_message = response.content[0].text
 
-        # Add to conversation history
-        self.add_assistant_message(assistant_message)
+        # Add to conversation history with the actual token count
+        self.add_assistant_message(assistant_message,
+                                   token_count=response.usage.output_tokens)
+
+        # Speculatively answer likely follow-ups in the background so the
+        # next turn can be served from cache
+        if self.prefetch:
+            self._spawn_prefetch()
 
         return assistant_message, response
 
+    def _spawn_prefetch(self):
+        """Kick off background prefetching of likely follow-up questions"""
+        snapshot = list(self.messages)
+        threading.Thread(target=self._prefetch_followups,
+                         args=(snapshot,), daemon=True).start()
+
+    def _prefetch_followups(self, history, n=3):
+        """Predict the user's next questions and pre-answer them
+
+        Uses the fast/cheap Haiku model to guess follow-ups, then answers
+        each against the current history. When the user's next message
+        matches a prediction, get_response returns instantly.
+        """
+        try:
+            prediction = client.messages.create(
+                model="claude-haiku-4-5-20251001",
+                max_tokens=200,
+                messages=history + [{
+                    "role": "user",
+                    "content": f"List the {n} most likely follow-up questions "
+                               "the user will ask next, one per line, with no "
+                               "numbering or other text."
+                }]
+            )
+            questions = [q.strip() for q in
+                         prediction.content[0].text.splitlines() if q.strip()]
+
+            for question in questions[:n]:
+                key = question.strip().lower()
+                if key in self._prefetched:
+                    continue
+                answer = client.messages.create(
+                    model=self.model,
+                    max_tokens=1000,
+                    messages=history + [{"role": "user", "content": question}]
+                )
+                self._prefetched[key] = answer.content[0].text
+        except Exception:
+            # Prefetching is purely speculative - never surface its errors
+            pass
+
+    def stream_response(self, max_tokens=1000, temperature=1.0):
+        """Stream Claude's response token by token
+
+        Yields text chunks as they arrive, so the first tokens surface
+        after first-token latency instead of full-generation time. The
+        complete reply is added to the conversation history at the end.
+        """
+        self._trim_to_budget()
+
+        kwargs = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": list(self.messages)
+        }
+
+        if self.system_prompt:
+            kwargs["system"] = self.system_prompt
+
+        parts = []
+        with client.messages.stream(**kwargs) as stream:
+            for text in stream.text_stream:
+                parts.append(text)
+                yield text
+            final = stream.get_final_message()
+
+        self.add_assistant_message("".join(parts),
+                                   token_count=final.usage.output_tokens)
+
     def clear(self):
         """Clear the conversation history"""
-        self.messages = []
+        self.messages.clear()
+        self.token_counts.clear()
 
 
 def simple_conversation():
@@ -136,9 +269,11 @@ def interactive_conversation():
         conversation.add_user_message(user_input)
 
         try:
-            response, metadata = conversation.get_response()
-            print(f"\nClaude: {response}\n")
-            print(f"[Tokens - Input: {metadata.usage.input_tokens}, Output: {metadata.usage.output_tokens}]\n")
+            # Stream so tokens appear as they are generated
+            print("\nClaude: ", end="", flush=True)
+            for text in conversation.stream_response():
+                print(text, end="", flush=True)
+            print("\n")
         except Exception as e:
             print(f"Error: {e}\n")
             break
@@ -8,12 +8,18 @@ This example demonstrates:
 - Error handling
 """
 
-from anthropic import Anthropic
-import os
+import ast
+import asyncio
 import json
 import base64
+import operator
+import sys
+import time
 
-client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY", "your-api-key-here"))
+from _client import get_client, get_async_client
+
+client = get_client()
+async_client = get_async_client()
 
 
 def streaming_response():
@@ -22,19 +28,74 @@ def streaming_response():
 
     print("Claude's response (streaming): ", end="", flush=True)
 
+    # Buffer tokens and flush every ~50ms: a flush per token means a
+    # syscall per token, which dominates CPU for long outputs while
+    # looking no more "live" to the reader
+    buf = []
+    last_flush = time.monotonic()
+
     with client.messages.stream(
         model="claude-opus-4-1-20250805",
         max_tokens=500,
         messages=[{"role": "user", "content": "Write a haiku about programming"}]
     ) as stream:
         for text in stream.text_stream:
-            print(text, end="", flush=True)
+            buf.append(text)
+            now = time.monotonic()
+            if now - last_flush > 0.05:
+                sys.stdout.write("".join(buf))
+                sys.stdout.flush()
+                buf.clear()
+                last_flush = now
+
+    if buf:
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
 
     print("\n\n" + "="*50 + "\n")
 
 
+# eval() on model-generated input is not safe even with empty builtins;
+# walk the AST and allow only numeric literals and basic arithmetic
+_ARITHMETIC_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+
+
+def evaluate_expression(expression):
+    """Evaluate a basic arithmetic expression (numbers, + - * / only)."""
+    def _eval(node):
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            return node.value
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+            return +_eval(node.operand) if isinstance(node.op, ast.UAdd) else -_eval(node.operand)
+        if isinstance(node, ast.BinOp) and type(node.op) in _ARITHMETIC_OPS:
+            return _ARITHMETIC_OPS[type(node.op)](_eval(node.left), _eval(node.right))
+        raise ValueError(f"Unsupported expression: {expression!r}")
+
+    return _eval(ast.parse(expression, mode="eval").body)
+
+
+async def execute_tool(name, tool_input):
+    """Execute a tool call (stub implementations for the example)"""
+    if name == "get_weather":
+        return {"location": tool_input["location"],
+                "temperature": 18, "condition": "sunny"}
+    if name == "calculator":
+        return {"result": evaluate_expression(tool_input["expression"])}
+    raise ValueError(f"Unknown tool: {name}")
+
+
 def tool_use_example():
     """Demonstrate tool use (function calling)"""
+    asyncio.run(_tool_use_example())
+
+
+async def _tool_use_example():
+    """Tool use with independent tool calls executed concurrently"""
     print("=== Tool Use Example ===\n")
 
     # Define tools that Claude can use
@@ -75,15 +136,17 @@ def tool_use_example():
     ]
 
     # Send a message that should trigger tool use
-    response = client.messages.create(
+    messages = [
+        {"role": "user", "content": "What's the weather like in San Francisco? Also, what's 15 * 27?"}
+    ]
+    response = await async_client.messages.create(
         model="claude-opus-4-1-20250805",
         max_tokens=1000,
         tools=tools,
-        messages=[
-            {"role": "user", "content": "What's the weather like in San Francisco? Also, what's 15 * 27?"}
-        ]
+        messages=messages
     )
 
+    tool_uses = []
     print("Claude's response:")
     for content in response.content:
         if content.type == "text":
@@ -91,6 +154,38 @@ def tool_use_example():
         elif content.type == "tool_use":
             print(f"\nTool Called: {content.name}")
             print(f"Tool Input: {json.dumps(content.input, indent=2)}")
+            tool_uses.append(content)
+
+    if tool_uses:
+        # Independent tool calls run concurrently: N calls cost
+        # max(t_i) instead of sum(t_i)
+        results = await asyncio.gather(
+            *(execute_tool(block.name, block.input) for block in tool_uses)
+        )
+
+        # Send all results back in a single follow-up turn
+        messages.append({"role": "assistant", "content": response.content})
+        messages.append({
+            "role": "user",
+            "content": [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": block.id,
+                    "content": json.dumps(result)
+                }
+                for block, result in zip(tool_uses, results)
+            ]
+        })
+
+        final = await async_client.messages.create(
+            model="claude-opus-4-1-20250805",
+            max_tokens=1000,
+            tools=tools,
+            messages=messages
+        )
+
+        print("\nFinal answer:")
+        print(final.content[0].text)
 
     print("\n" + "="*50 + "\n")
 
@@ -5,18 +5,85 @@ This example demonstrates how to integrate Claude AI
 into a FastAPI application for various use cases.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from anthropic import Anthropic, AsyncAnthropic
-import os
+import orjson
 from typing import List, Optional
 
-# Initialize FastAPI app
-app = FastAPI(title="AI-Powered API with Claude")
+from _client import get_async_client
+from batched_client import BatchedClaudeClient
+from llm_cache import LLMCache, cache_key
+from semantic_cache import SemanticCache
 
-# Initialize Anthropic client
-client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY", "your-api-key-here"))
-async_client = AsyncAnthropic(api_key=os.environ.get("ANTHROPIC_API_KEY", "your-api-key-here"))
+# One shared async client (see _client.py): every endpoint is async, so
+# a sync client would only hold an idle pool, and HTTP/2 multiplexes all
+# concurrent requests over one TCP+TLS connection.
+async_client = get_async_client()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.claude = async_client
+    yield
+    await async_client.close()
+
+
+# Initialize FastAPI app (orjson encodes responses ~3-5x faster than stdlib json)
+app = FastAPI(title="AI-Powered API with Claude",
+              default_response_class=ORJSONResponse,
+              lifespan=lifespan)
+
+# Exact-match response cache: repeated identical requests skip the API call
+llm_cache = LLMCache(default_ttl=3600)
+
+# Static prompt preambles, sent as cacheable system blocks so Anthropic's
+# prompt cache serves them on repeat requests (static content first,
+# dynamic values only in the trailing user message)
+SUGGEST_ACTIVITIES_SYSTEM = """Based on the student information provided by the user,
+suggest 2-3 extracurricular activities that would be a good fit.
+
+Provide specific, actionable suggestions with brief explanations."""
+
+SUMMARIZE_ACTIVITY_SYSTEM = """Create a brief, engaging description for the high school
+extracurricular activity named by the user.
+Make it appealing to students in 2-3 sentences."""
+
+ANALYZE_PARTICIPATION_SYSTEM = """Analyze the activity participation data provided by the
+user and provide insights:
+
+1. Key trends
+2. Popular activities
+3. Recommendations for improving participation"""
+
+
+def cached_system_block(text: str) -> list:
+    """Wrap a static system prompt so the API caches its tokens."""
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+# User-message templates, hoisted so the literal is compiled once and the
+# static bytes stay identical across calls (keeps prompt-cache prefixes stable)
+_SUGGEST_USER_TMPL = "- Grade Level: {grade}\n- Interests: {interests}"
+_SUMMARIZE_USER_TMPL = 'The activity is called "{name}".'
+
+# Short, low-complexity blurbs don't need Sonnet: Haiku is ~10x cheaper
+# with lower per-token latency
+SUMMARIZE_MODEL = "claude-haiku-4-5-20251001"
+
+# Semantic cache: near-duplicate free-text prompts also skip the API call
+# (no-op unless sentence-transformers is installed)
+semantic_cache = SemanticCache(threshold=0.92)
+
+# Micro-batcher: concurrent requests within a 30ms window share one API call
+batched_client = BatchedClaudeClient(async_client)
+
+# Cap concurrent outbound Claude calls below the rate-limit knee, so a
+# burst of inbound requests queues briefly instead of triggering 429s
+# and retry amplification
+CLAUDE_SEM = asyncio.Semaphore(20)
 
 
 # Request/Response Models
@@ -59,14 +126,23 @@ async def chat_with_claude(request: ChatRequest):
         if request.system_prompt:
             kwargs["system"] = request.system_prompt
 
-        response = await async_client.messages.create(**kwargs)
+        key = cache_key(**kwargs)
+        cached = await llm_cache.get(key)
+        if cached is not None:
+            return ChatResponse(**cached)
 
-        return ChatResponse(
-            response=response.content[0].text,
-            model=response.model,
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens
-        )
+        async with CLAUDE_SEM:
+            response = await async_client.messages.create(**kwargs)
+
+        result = {
+            "response": response.content[0].text,
+            "model": response.model,
+            "input_tokens": response.usage.input_tokens,
+            "output_tokens": response.usage.output_tokens,
+        }
+        await llm_cache.set(key, result)
+
+        return ChatResponse(**result)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"AI Error: {str(e)}")
@@ -80,21 +156,32 @@ async def suggest_activities(request: ActivitySuggestionRequest):
     try:
         interests_str = ", ".join(request.student_interests)
 
-        prompt = f"""Based on the following student information, suggest 2-3 extracurricular
-activities that would be a good fit:
+        prompt = _SUGGEST_USER_TMPL.format_map(
+            {"grade": request.grade_level, "interests": interests_str})
+
+        kwargs = {
+            "model": "claude-sonnet-4-5-20250929",
+            "max_tokens": 500,
+            "system": cached_system_block(SUGGEST_ACTIVITIES_SYSTEM),
+            "messages": [{"role": "user", "content": prompt}]
+        }
+
+        key = cache_key(**kwargs)
+        cached = await llm_cache.get(key)
+        if cached is not None:
+            return ActivitySuggestion(suggestion=cached)
 
-- Grade Level: {request.grade_level}
-- Interests: {interests_str}
+        similar = await semantic_cache.get(prompt)
+        if similar is not None:
+            return ActivitySuggestion(suggestion=similar)
 
-Provide specific, actionable suggestions with brief explanations."""
+        suggestion = await batched_client.submit(
+            prompt, system=SUGGEST_ACTIVITIES_SYSTEM, max_tokens=500)
 
-        response = await async_client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=500,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        await llm_cache.set(key, suggestion)
+        await semantic_cache.set(prompt, suggestion)
 
-        return ActivitySuggestion(suggestion=response.content[0].text)
+        return ActivitySuggestion(suggestion=suggestion)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"AI Error: {str(e)}")
@@ -106,42 +193,96 @@ async def summarize_activity(activity_name: str):
     Generate a compelling summary for an activity using AI
     """
     try:
-        prompt = f"""Create a brief, engaging description for a high school
-extracurricular activity called "{activity_name}".
-Make it appealing to students in 2-3 sentences."""
+        prompt = _SUMMARIZE_USER_TMPL.format_map({"name": activity_name})
+
+        kwargs = {
+            "model": SUMMARIZE_MODEL,
+            "max_tokens": 200,
+            "system": cached_system_block(SUMMARIZE_ACTIVITY_SYSTEM),
+            "messages": [{"role": "user", "content": prompt}]
+        }
+
+        key = cache_key(**kwargs)
+        cached = await llm_cache.get(key)
+        if cached is not None:
+            return {"activity_name": activity_name, "summary": cached}
+
+        similar = await semantic_cache.get(prompt)
+        if similar is not None:
+            return {"activity_name": activity_name, "summary": similar}
+
+        summary = await batched_client.submit(
+            prompt, system=SUMMARIZE_ACTIVITY_SYSTEM, max_tokens=200,
+            model=SUMMARIZE_MODEL)
 
-        response = await async_client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=200,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        await llm_cache.set(key, summary)
+        await semantic_cache.set(prompt, summary)
 
-        return {"activity_name": activity_name, "summary": response.content[0].text}
+        return {"activity_name": activity_name, "summary": summary}
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"AI Error: {str(e)}")
 
 
+def summarize_participation(activity_data: dict) -> str:
+    """
+    Reduce raw participation data to a compact numeric summary.
+
+    Claude only does qualitative commentary, so sending kilobytes of raw
+    data wastes input tokens; local aggregation shrinks the prompt to a
+    handful of numbers.
+    """
+    def count(entry):
+        participants = entry.get("participants", 0)
+        return len(participants) if isinstance(participants, list) else int(participants)
+
+    counts = {name: count(entry) for name, entry in activity_data.items()}
+    capacities = {name: int(entry.get("max_participants", 0))
+                  for name, entry in activity_data.items()}
+
+    total = sum(counts.values())
+    capacity = sum(capacities.values())
+    ranked = sorted(counts, key=counts.get, reverse=True)
+
+    lines = [
+        f"Activities: {len(counts)}",
+        f"Total participants: {total}",
+        f"Total capacity: {capacity}",
+        f"Overall fill rate: {total / capacity * 100:.1f}%" if capacity else "Overall fill rate: n/a",
+        f"Most popular: {', '.join(f'{n} ({counts[n]})' for n in ranked[:3])}",
+        f"Least popular: {', '.join(f'{n} ({counts[n]})' for n in ranked[-3:])}",
+    ]
+    for name in ranked:
+        fill = f"{counts[name] / capacities[name] * 100:.0f}%" if capacities[name] else "n/a"
+        lines.append(f"- {name}: {counts[name]}/{capacities[name]} ({fill})")
+
+    return "\n".join(lines)
+
+
 @app.post("/api/analyze-participation")
 async def analyze_participation(activity_data: dict):
     """
     Analyze activity participation patterns using AI
     """
     try:
-        prompt = f"""Analyze the following activity participation data and provide insights:
+        prompt = summarize_participation(activity_data)
+
+        kwargs = {
+            "model": "claude-sonnet-4-5-20250929",
+            "max_tokens": 800,
+            "system": cached_system_block(ANALYZE_PARTICIPATION_SYSTEM),
+            "messages": [{"role": "user", "content": prompt}]
+        }
 
-{activity_data}
+        key = cache_key(**kwargs)
+        cached = await llm_cache.get(key)
+        if cached is not None:
+            return {"analysis": cached}
 
-Provide:
-1. Key trends
-2. Popular activities
-3. Recommendations for improving participation"""
+        async with CLAUDE_SEM:
+            response = await async_client.messages.create(**kwargs)
 
-        response = await async_client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=800,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        await llm_cache.set(key, response.content[0].text)
 
         return {"analysis": response.content[0].text}
 
@@ -151,7 +292,11 @@ Provide:
 
 # Streaming endpoint example
 from fastapi.responses import StreamingResponse
-import json
+
+# Pre-encoded SSE frame delimiters, so each token costs exactly one
+# orjson encode and one bytes concatenation
+SSE_PREFIX = b"data: "
+SSE_SUFFIX = b"\n\n"
 
 
 @app.post("/api/chat-stream")
@@ -160,6 +305,7 @@ async def chat_stream(request: ChatRequest):
     Streaming chat endpoint that returns responses as they're generated
     """
     async def generate():
+        # Yield bytes directly so Starlette skips a per-chunk re-encode
         try:
             kwargs = {
                 "model": "claude-sonnet-4-5-20250929",
@@ -170,12 +316,13 @@ async def chat_stream(request: ChatRequest):
             if request.system_prompt:
                 kwargs["system"] = request.system_prompt
 
-            async with async_client.messages.stream(**kwargs) as stream:
-                async for text in stream.text_stream:
-                    yield f"data: {json.dumps({'text': text})}\n\n"
+            async with CLAUDE_SEM:
+                async with async_client.messages.stream(**kwargs) as stream:
+                    async for text in stream.text_stream:
+                        yield SSE_PREFIX + orjson.dumps({"text": text}) + SSE_SUFFIX
 
         except Exception as e:
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield SSE_PREFIX + orjson.dumps({"error": str(e)}) + SSE_SUFFIX
 
     return StreamingResponse(generate(), media_type="text/event-stream")
 
@@ -0,0 +1,38 @@
+"""
+Shared Anthropic Client Singletons
+
+Each example module used to construct its own client at import time, so
+importing several examples together (e.g. from a test harness) allocated
+one httpx connection pool and TLS session cache per module. These lazy
+singletons ensure one sync and one async client are shared everywhere.
+"""
+
+import functools
+import os
+
+import httpx
+from anthropic import Anthropic, AsyncAnthropic
+
+
+def _api_key() -> str:
+    return os.environ.get("ANTHROPIC_API_KEY", "your-api-key-here")
+
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> Anthropic:
+    """Shared synchronous client (one connection pool for all examples)."""
+    return Anthropic(api_key=_api_key())
+
+
+@functools.lru_cache(maxsize=1)
+def get_async_client() -> AsyncAnthropic:
+    """Shared async client with retries, timeout and HTTP/2 multiplexing."""
+    return AsyncAnthropic(
+        api_key=_api_key(),
+        max_retries=2,
+        timeout=30.0,
+        http_client=httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        ),
+    )
@@ -0,0 +1,114 @@
+"""
+Micro-Batching Claude Client
+
+Under burst traffic, every request pays its own HTTPS round-trip to the
+API. This client collects requests that arrive within a short window
+(default 30ms) and dispatches them as a single Claude call that returns
+a JSON array, fanning the per-item responses back through per-request
+asyncio Futures. N round-trips become 1.
+
+Single-item windows skip the batch framing and go out as a normal
+messages.create call, so light traffic pays no overhead.
+"""
+
+import asyncio
+import json
+from typing import Optional
+
+BATCH_SYSTEM = """You will receive a JSON array of independent items, each with an
+"idx", "instructions" and "input" field. Handle every item separately by
+following its instructions against its input.
+
+Respond with ONLY a JSON array of objects of the form
+{"idx": <idx>, "response": "<your response for that item>"} — one per
+input item, no other text."""
+
+
+class BatchedClaudeClient:
+    """Collects concurrent requests into single multi-item Claude calls."""
+
+    def __init__(self, async_client, model="claude-sonnet-4-5-20250929",
+                 window: float = 0.03, batch_size: int = 16):
+        self.async_client = async_client
+        self.model = model
+        self.window = window
+        self.batch_size = batch_size
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, prompt: str, system: Optional[str] = None,
+                     max_tokens: int = 500, model: Optional[str] = None) -> str:
+        """Submit one request; resolves when its batch completes."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.ensure_future(self._run())
+
+        future = asyncio.get_event_loop().create_future()
+        await self._queue.put((prompt, system, max_tokens, model or self.model, future))
+        return await future
+
+    async def _run(self):
+        """Background loop: drain a window's worth of requests, dispatch."""
+        while True:
+            batch = [await self._queue.get()]
+
+            # Collect whatever else arrives within the batching window
+            deadline = asyncio.get_event_loop().time() + self.window
+            while len(batch) < self.batch_size:
+                remaining = deadline - asyncio.get_event_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Items targeting different models cannot share one call
+            by_model = {}
+            for entry in batch:
+                by_model.setdefault(entry[3], []).append(entry)
+            for group in by_model.values():
+                await self._dispatch(group)
+
+    async def _dispatch(self, batch):
+        model = batch[0][3]
+        try:
+            if len(batch) == 1:
+                prompt, system, max_tokens, _, future = batch[0]
+                kwargs = {
+                    "model": model,
+                    "max_tokens": max_tokens,
+                    "messages": [{"role": "user", "content": prompt}],
+                }
+                if system:
+                    kwargs["system"] = [{"type": "text", "text": system,
+                                         "cache_control": {"type": "ephemeral"}}]
+                response = await self.async_client.messages.create(**kwargs)
+                future.set_result(response.content[0].text)
+                return
+
+            items = [
+                {"idx": i, "instructions": system or "", "input": prompt}
+                for i, (prompt, system, _, _, _) in enumerate(batch)
+            ]
+            response = await self.async_client.messages.create(
+                model=model,
+                max_tokens=sum(max_tokens for _, _, max_tokens, _, _ in batch),
+                system=[{"type": "text", "text": BATCH_SYSTEM,
+                         "cache_control": {"type": "ephemeral"}}],
+                messages=[{"role": "user", "content": json.dumps(items)}],
+            )
+
+            results = {item["idx"]: item["response"]
+                       for item in json.loads(response.content[0].text)}
+            for i, (_, _, _, _, future) in enumerate(batch):
+                if i in results:
+                    future.set_result(results[i])
+                else:
+                    future.set_exception(
+                        RuntimeError(f"Batch response missing item {i}"))
+
+        except Exception as e:
+            for entry in batch:
+                future = entry[4]
+                if not future.done():
+                    future.set_exception(e)
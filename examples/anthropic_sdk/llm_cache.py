@@ -0,0 +1,86 @@
+"""
+Exact-Match LLM Response Cache
+
+A small in-process TTL cache for Claude responses. Identical requests
+(same model, messages, system prompt and max_tokens) are served from
+memory instead of paying the full network + token cost again.
+
+Keys are deterministic SHA256 hashes of the request parameters, so the
+cache only ever returns a response for an exactly matching request.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any, Dict, Optional
+
+
+def cache_key(**kwargs) -> Optional[str]:
+    """
+    Build a deterministic cache key from Claude request parameters.
+
+    Returns None when the request should not be cached (temperature > 0
+    makes responses non-deterministic, so caching them would pin one
+    random sample).
+    """
+    if kwargs.get("temperature", 0) > 0:
+        return None
+
+    payload = json.dumps(
+        {
+            "model": kwargs.get("model"),
+            "messages": kwargs.get("messages"),
+            "system": kwargs.get("system"),
+            "max_tokens": kwargs.get("max_tokens"),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    In-process TTL cache with an async get/set interface.
+
+    The interface is async so the implementation can be swapped for a
+    shared backend (e.g. redis.asyncio) in multi-worker deployments
+    without touching the call sites.
+    """
+
+    def __init__(self, max_entries: int = 1024, default_ttl: float = 3600.0):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: Dict[str, tuple] = {}  # key -> (expires_at, value)
+        self._lock = asyncio.Lock()
+
+    async def get(self, key: Optional[str]) -> Optional[Any]:
+        """Return the cached value for key, or None on miss/expiry."""
+        if key is None:
+            return None
+
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+
+            return value
+
+    async def set(self, key: Optional[str], value: Any, ttl: Optional[float] = None):
+        """Store a value under key, evicting the oldest entry when full."""
+        if key is None:
+            return
+
+        async with self._lock:
+            if len(self._entries) >= self.max_entries and key not in self._entries:
+                # Evict the entry closest to expiry
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest]
+
+            expires_at = time.monotonic() + (ttl if ttl is not None else self.default_ttl)
+            self._entries[key] = (expires_at, value)
@@ -0,0 +1,85 @@
+"""
+Semantic LLM Response Cache
+
+Free-text inputs like student interests or activity names often arrive
+in semantically equivalent variants ("chess", "Chess Club", "chess team")
+that an exact-match cache misses. This cache embeds each prompt with a
+local MiniLM model and returns the stored response whose cosine
+similarity exceeds a threshold, turning a multi-second Claude call into
+a few milliseconds of local embedding + vector search.
+
+Requires the optional `sentence-transformers` package. When it is not
+installed the cache degrades to a no-op so callers need no guards.
+"""
+
+import asyncio
+from typing import List, Optional
+
+try:  # Optional dependency - cache is disabled without it
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    EMBEDDINGS_AVAILABLE = True
+except ImportError:
+    EMBEDDINGS_AVAILABLE = False
+
+
+class SemanticCache:
+    """
+    Similarity-based cache over prompt embeddings.
+
+    Embeddings are L2-normalized at encode time, so cosine similarity is
+    a plain dot product against the stored matrix. The cache is small
+    and in-process, so a linear scan is faster than maintaining an ANN
+    index.
+    """
+
+    def __init__(self, threshold: float = 0.92,
+                 model_name: str = "all-MiniLM-L6-v2",
+                 max_entries: int = 512):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._model = SentenceTransformer(model_name) if EMBEDDINGS_AVAILABLE else None
+        self._embeddings = None  # (n, dim) float32 matrix
+        self._responses: List[str] = []
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._model is not None
+
+    def _encode(self, prompt: str):
+        return self._model.encode(prompt, normalize_embeddings=True)
+
+    async def get(self, prompt: str) -> Optional[str]:
+        """Return the cached response for a semantically similar prompt."""
+        if not self.enabled:
+            return None
+
+        async with self._lock:
+            if self._embeddings is None or len(self._responses) == 0:
+                return None
+
+            emb = self._encode(prompt)
+            scores = self._embeddings @ emb
+            best = int(np.argmax(scores))
+            if scores[best] > self.threshold:
+                return self._responses[best]
+
+            return None
+
+    async def set(self, prompt: str, response: str):
+        """Store a prompt/response pair for future similarity hits."""
+        if not self.enabled:
+            return
+
+        async with self._lock:
+            emb = self._encode(prompt)[None, :]
+            if self._embeddings is None:
+                self._embeddings = emb
+            else:
+                if len(self._responses) >= self.max_entries:
+                    # Drop the oldest entry to keep the scan bounded
+                    self._embeddings = self._embeddings[1:]
+                    self._responses.pop(0)
+                self._embeddings = np.vstack([self._embeddings, emb])
+            self._responses.append(response)
@@ -5,40 +5,42 @@ This implementation provides an HTTP interface for the MCP server,
 allowing it to be accessed by Claude and other AI assistants over the network.
 """
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import Any, Dict, List, Optional
+from fastapi import Body, FastAPI, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
-from simple_mcp_server import SchoolActivitiesMCPServer
-
-
-# Request/Response Models
-class ToolCallRequest(BaseModel):
-    tool_name: str
-    arguments: Dict[str, Any] = {}
-
-
-class ResourceRequest(BaseModel):
-    uri: str
-
-
-class MCPResponse(BaseModel):
-    success: bool
-    data: Optional[Any] = None
-    error: Optional[str] = None
+from simple_mcp_server import (
+    ResourceNotFound,
+    SchoolActivitiesMCPServer,
+    ToolError,
+    ToolNotFound,
+)
 
 
 # Create FastAPI app
 app = FastAPI(
     title="School Activities MCP Server",
     description="MCP server providing access to school activities data and operations",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# Compress tool listings and catalog payloads over ~500 bytes
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
 # Initialize MCP server
 mcp_server = SchoolActivitiesMCPServer()
 
 
+# Dispatch errors surface as exceptions (no {"error": ...} wrapper to
+# allocate and re-check per call); these handlers translate them to HTTP
+@app.exception_handler(ToolNotFound)
+@app.exception_handler(ResourceNotFound)
+@app.exception_handler(ToolError)
+async def mcp_error_handler(request, exc):
+    return ORJSONResponse(status_code=404, content={"detail": str(exc)})
+
+
 @app.get("/")
 def root():
     """Root endpoint with server info"""
@@ -78,30 +80,35 @@ def list_resources():
 
 
 @app.post("/tools/call")
-async def call_tool(request: ToolCallRequest):
+async def call_tool(body: dict = Body(...)):
     """
     Call a tool with the specified arguments
 
+    The body is taken as a raw dict: the schema is just a string plus an
+    opaque arguments object, so a Pydantic model per request would only
+    re-validate what call_tool already checks.
+
     Example request:
     {
         "tool_name": "get_activities",
         "arguments": {}
     }
     """
-    result = await mcp_server.call_tool(request.tool_name, request.arguments)
+    tool_name = body.get("tool_name")
+    if not tool_name:
+        raise HTTPException(status_code=400, detail="tool_name is required")
 
-    if "error" in result:
-        raise HTTPException(status_code=400, detail=result["error"])
+    result = await mcp_server.call_tool(tool_name, body.get("arguments") or {})
 
     return {
         "success": True,
-        "tool": request.tool_name,
-        "result": result["result"]
+        "tool": tool_name,
+        "result": result
     }
 
 
 @app.post("/resources/get")
-async def get_resource(request: ResourceRequest):
+async def get_resource(body: dict = Body(...)):
     """
     Get a resource by URI
 
@@ -110,15 +117,16 @@ async def get_resource(request: ResourceRequest):
         "uri": "activities://catalog"
     }
     """
-    result = await mcp_server.get_resource(request.uri)
+    uri = body.get("uri")
+    if not uri:
+        raise HTTPException(status_code=400, detail="uri is required")
 
-    if "error" in result:
-        raise HTTPException(status_code=404, detail=result["error"])
+    content = await mcp_server.get_resource(uri)
 
     return {
         "success": True,
-        "uri": request.uri,
-        "content": result["content"]
+        "uri": uri,
+        "content": content
     }
 
 
@@ -126,37 +134,25 @@ async def get_resource(request: ResourceRequest):
 @app.get("/api/activities")
 async def get_activities():
     """Get list of all activities"""
-    result = await mcp_server.call_tool("get_activities", {})
-    return result["result"]
+    return await mcp_server.call_tool("get_activities", {})
 
 
 @app.get("/api/activities/{activity_name}")
 async def get_activity_details(activity_name: str):
     """Get details for a specific activity"""
-    result = await mcp_server.call_tool("get_activity_details", {"activity_name": activity_name})
-
-    if "error" in result:
-        raise HTTPException(status_code=404, detail=result["error"])
-
-    return result["result"]
+    return await mcp_server.call_tool("get_activity_details", {"activity_name": activity_name})
 
 
 @app.get("/api/activities/{activity_name}/availability")
 async def check_activity_availability(activity_name: str):
     """Check availability for a specific activity"""
-    result = await mcp_server.call_tool("check_availability", {"activity_name": activity_name})
-
-    if "error" in result:
-        raise HTTPException(status_code=404, detail=result["error"])
-
-    return result["result"]
+    return await mcp_server.call_tool("check_availability", {"activity_name": activity_name})
 
 
 @app.get("/api/stats")
 async def get_participation_stats():
     """Get participation statistics"""
-    result = await mcp_server.get_resource("activities://stats")
-    return result["content"]
+    return await mcp_server.get_resource("activities://stats")
 
 
 if __name__ == "__main__":
@@ -175,4 +171,7 @@ if __name__ == "__main__":
     print("  - GET  /api/activities/{name}/availability - Check availability")
     print("  - GET  /api/stats - Get participation stats")
 
-    uvicorn.run(app, host="0.0.0.0", port=5000)
+    # uvloop + httptools (from uvicorn[standard]) give a C event loop and
+    # HTTP parser; access logging is skipped to cut per-request work
+    uvicorn.run(app, host="0.0.0.0", port=5000,
+                loop="uvloop", http="httptools", access_log=False)
@@ -14,6 +14,22 @@ import asyncio
 from datetime import datetime
 
 
+class MCPError(Exception):
+    """Base class for MCP dispatch errors."""
+
+
+class ToolNotFound(MCPError):
+    """Raised when no handler is registered for a tool name."""
+
+
+class ResourceNotFound(MCPError):
+    """Raised when no handler is registered for a resource URI."""
+
+
+class ToolError(MCPError):
+    """Raised by a handler when a call cannot be fulfilled."""
+
+
 class MCPServer:
     """
     Simple MCP Server implementation
@@ -26,70 +42,92 @@ class MCPServer:
         self.version = version
         self.tools = {}
         self.resources = {}
+        # Flat dispatch tables: one .get() resolves a handler on the hot
+        # path; the descriptive dicts above exist only for listings
+        self._tool_handlers = {}
+        self._resource_handlers = {}
+        # Listing payloads are pure projections of the registries, which
+        # are immutable after startup - build them once per registration
+        self._tools_cache = None
+        self._resources_cache = None
 
     def register_tool(self, name: str, description: str, parameters: Dict, handler):
-        """Register a tool that can be called by the AI"""
+        """Register a tool that can be called by the AI.
+
+        Handlers may be plain functions or coroutine functions; which one
+        is decided here, once, not per call.
+        """
         self.tools[name] = {
             "name": name,
             "description": description,
-            "parameters": parameters,
-            "handler": handler
+            "parameters": parameters
         }
+        self._tool_handlers[name] = (handler, asyncio.iscoroutinefunction(handler))
+        self._tools_cache = None
 
     def register_resource(self, uri: str, name: str, description: str, handler):
         """Register a resource that can be accessed by the AI"""
         self.resources[uri] = {
             "uri": uri,
             "name": name,
-            "description": description,
-            "handler": handler
+            "description": description
         }
-
-    async def call_tool(self, tool_name: str, arguments: Dict) -> Dict[str, Any]:
-        """Execute a tool with the given arguments"""
-        if tool_name not in self.tools:
-            return {"error": f"Tool '{tool_name}' not found"}
-
-        tool = self.tools[tool_name]
-        try:
-            result = await tool["handler"](arguments)
-            return {"result": result}
-        except Exception as e:
-            return {"error": str(e)}
-
-    async def get_resource(self, uri: str) -> Dict[str, Any]:
-        """Retrieve a resource by URI"""
-        if uri not in self.resources:
-            return {"error": f"Resource '{uri}' not found"}
-
-        resource = self.resources[uri]
-        try:
-            content = await resource["handler"]()
-            return {"content": content}
-        except Exception as e:
-            return {"error": str(e)}
+        self._resource_handlers[uri] = (handler, asyncio.iscoroutinefunction(handler))
+        self._resources_cache = None
+
+    async def call_tool(self, tool_name: str, arguments: Dict) -> Any:
+        """Execute a tool and return its result.
+
+        Raises ToolNotFound for unknown tools; handler exceptions
+        propagate to the caller. Errors travel as exceptions instead of
+        {"error": ...} wrappers, so the success path allocates nothing
+        beyond the handler's own result.
+        """
+        entry = self._tool_handlers.get(tool_name)
+        if entry is None:
+            raise ToolNotFound(f"Tool '{tool_name}' not found")
+        handler, is_async = entry
+        # Sync handlers run as straight calls: no coroutine allocation,
+        # no scheduler hop
+        return await handler(arguments) if is_async else handler(arguments)
+
+    async def get_resource(self, uri: str) -> Any:
+        """Retrieve a resource by URI.
+
+        Raises ResourceNotFound for unknown URIs; handler exceptions
+        propagate to the caller.
+        """
+        entry = self._resource_handlers.get(uri)
+        if entry is None:
+            raise ResourceNotFound(f"Resource '{uri}' not found")
+        handler, is_async = entry
+        return await handler() if is_async else handler()
 
     def list_tools(self) -> List[Dict[str, Any]]:
         """List all available tools"""
-        return [
-            {
-                "name": tool["name"],
-                "description": tool["description"],
-                "parameters": tool["parameters"]
-            }
-            for tool in self.tools.values()
-        ]
+        if self._tools_cache is None:
+            self._tools_cache = [
+                {
+                    "name": tool["name"],
+                    "description": tool["description"],
+                    "parameters": tool["parameters"]
+                }
+                for tool in self.tools.values()
+            ]
+        return self._tools_cache
 
     def list_resources(self) -> List[Dict[str, Any]]:
         """List all available resources"""
-        return [
-            {
-                "uri": resource["uri"],
-                "name": resource["name"],
-                "description": resource["description"]
-            }
-            for resource in self.resources.values()
-        ]
+        if self._resources_cache is None:
+            self._resources_cache = [
+                {
+                    "uri": resource["uri"],
+                    "name": resource["name"],
+                    "description": resource["description"]
+                }
+                for resource in self.resources.values()
+            ]
+        return self._resources_cache
 
 
 # Example: School Activities MCP Server
@@ -117,12 +155,33 @@ class SchoolActivitiesMCPServer(MCPServer):
             }
         }
 
+        # Casefolded name -> (original name, details): one hash lookup
+        # serves "chess club", "Chess Club" and "CHESS CLUB" alike
+        self._activities_index = {
+            name.casefold(): (name, details)
+            for name, details in self.activities.items()
+        }
+
+        # Aggregates computed once: the store is immutable after init, so
+        # stats reads are O(1) instead of re-summing every activity
+        self._total_capacity = sum(
+            a["max_participants"] for a in self.activities.values())
+        self._total_participants = sum(
+            len(a["participants"]) for a in self.activities.values())
+
         # Register tools
         self._register_tools()
 
         # Register resources
         self._register_resources()
 
+    def _lookup_activity(self, activity_name):
+        """Resolve an activity case-insensitively; raises ToolError if unknown."""
+        entry = self._activities_index.get((activity_name or "").casefold())
+        if entry is None:
+            raise ToolError(f"Activity '{activity_name}' not found")
+        return entry
+
     def _register_tools(self):
         """Register all available tools"""
 
@@ -191,18 +250,14 @@ class SchoolActivitiesMCPServer(MCPServer):
         )
 
     # Tool Handlers
-    async def _handle_get_activities(self, args: Dict) -> List[str]:
+    def _handle_get_activities(self, args: Dict) -> List[str]:
         """Handler for get_activities tool"""
         return list(self.activities.keys())
 
-    async def _handle_get_activity_details(self, args: Dict) -> Dict:
+    def _handle_get_activity_details(self, args: Dict) -> Dict:
         """Handler for get_activity_details tool"""
-        activity_name = args.get("activity_name")
-
-        if activity_name not in self.activities:
-            raise ValueError(f"Activity '{activity_name}' not found")
+        activity_name, activity = self._lookup_activity(args.get("activity_name"))
 
-        activity = self.activities[activity_name]
         return {
             "name": activity_name,
             "description": activity["description"],
@@ -212,14 +267,10 @@ class SchoolActivitiesMCPServer(MCPServer):
             "available_spots": activity["max_participants"] - len(activity["participants"])
         }
 
-    async def _handle_check_availability(self, args: Dict) -> Dict:
+    def _handle_check_availability(self, args: Dict) -> Dict:
         """Handler for check_availability tool"""
-        activity_name = args.get("activity_name")
-
-        if activity_name not in self.activities:
-            raise ValueError(f"Activity '{activity_name}' not found")
+        activity_name, activity = self._lookup_activity(args.get("activity_name"))
 
-        activity = self.activities[activity_name]
         available_spots = activity["max_participants"] - len(activity["participants"])
 
         return {
@@ -230,7 +281,7 @@ class SchoolActivitiesMCPServer(MCPServer):
         }
 
     # Resource Handlers
-    async def _resource_activities_catalog(self) -> str:
+    def _resource_activities_catalog(self) -> str:
         """Handler for activities catalog resource"""
         catalog = []
         for name, details in self.activities.items():
@@ -238,17 +289,14 @@ class SchoolActivitiesMCPServer(MCPServer):
 
         return "\n".join(catalog)
 
-    async def _resource_participation_stats(self) -> Dict:
+    def _resource_participation_stats(self) -> Dict:
         """Handler for participation statistics resource"""
-        total_capacity = sum(a["max_participants"] for a in self.activities.values())
-        total_participants = sum(len(a["participants"]) for a in self.activities.values())
-
         return {
             "timestamp": datetime.now().isoformat(),
             "total_activities": len(self.activities),
-            "total_capacity": total_capacity,
-            "total_participants": total_participants,
-            "overall_fill_rate": f"{(total_participants / total_capacity * 100):.1f}%"
+            "total_capacity": self._total_capacity,
+            "total_participants": self._total_participants,
+            "overall_fill_rate": f"{(self._total_participants / self._total_capacity * 100):.1f}%"
         }
 
 
@@ -291,8 +339,15 @@ async def main():
 
     # Example: Access a resource
     print("=== Example: Accessing participation stats resource ===")
-    result = await server.get_resource("activities://stats")
-    print(f"Result: {json.dumps(result, indent=2)}\n")
+    content = await server.get_resource("activities://stats")
+    print(f"Result: {json.dumps(content, indent=2)}\n")
+
+    # Example: Unknown tools raise instead of returning error dicts
+    print("=== Example: Calling an unknown tool ===")
+    try:
+        await server.call_tool("no_such_tool", {})
+    except ToolNotFound as e:
+        print(f"ToolNotFound: {e}\n")
 
 
 if __name__ == "__main__":
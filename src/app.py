@@ -7,110 +7,269 @@ for extracurricular activities at Mergington High School.
 Enhanced with AI capabilities powered by Anthropic's Claude.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
+from fastapi.responses import (ORJSONResponse, RedirectResponse, Response,
+                               StreamingResponse)
 from pydantic import BaseModel
+from dataclasses import dataclass
 from typing import List, Optional
+import asyncio
+import hashlib
+import json
 import os
-import re
+import time
+
+import orjson
+from mimetypes import guess_type
 from pathlib import Path
 
-# AI Integration (optional - only enabled if ANTHROPIC_API_KEY is set)
+# AI Integration (optional - only enabled if ANTHROPIC_API_KEY is set).
+# The async client lets multi-second LLM calls await on the event loop
+# instead of pinning a threadpool worker each.
 anthropic_client = None
 try:  # pragma: no cover - optional dependency
-    from anthropic import Anthropic
+    from anthropic import AsyncAnthropic
     ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
     if ANTHROPIC_API_KEY:
-        anthropic_client = Anthropic(api_key=ANTHROPIC_API_KEY)
+        anthropic_client = AsyncAnthropic(api_key=ANTHROPIC_API_KEY)
         AI_ENABLED = True
     else:
         AI_ENABLED = False
 except ImportError:  # pragma: no cover - optional dependency
     AI_ENABLED = False
 
+# Sonnet handles the open-ended endpoints; Haiku (roughly 4x faster)
+# serves the short, latency-sensitive summaries
+AI_MODEL = "claude-sonnet-4-5-20250929"
+AI_MODEL_FAST = "claude-haiku-4-5-20251001"
+
+# orjson serializes responses several times faster than stdlib json
 app = FastAPI(title="Mergington High School API",
-              description="API for viewing and signing up for extracurricular activities")
+              description="API for viewing and signing up for extracurricular activities",
+              default_response_class=ORJSONResponse)
+
+# Compress JSON and AI text payloads (3-5x smaller on the wire); tiny
+# responses are left alone
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
 
 # Mount the static files directory
 current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
+# The static tree is tiny and immutable at runtime, so slurp it into
+# memory once with precomputed ETags: the browser hot path becomes a dict
+# lookup (or a 304) instead of stat+read syscalls on the threadpool.
+_static_cache = {}
+for _path in (current_dir / "static").rglob("*"):
+    if _path.is_file():
+        _body = _path.read_bytes()
+        _etag = f'"{hashlib.blake2b(_body, digest_size=8).hexdigest()}"'
+        _media = guess_type(_path.name)[0] or "application/octet-stream"
+        _rel = _path.relative_to(current_dir / "static").as_posix()
+        _static_cache[f"/static/{_rel}"] = (_body, _etag, _media)
+
+
+@app.middleware("http")
+async def serve_static_from_memory(request: Request, call_next):
+    """Serve cached /static assets from memory; 304 on matching ETag."""
+    if request.method in ("GET", "HEAD"):
+        entry = _static_cache.get(request.url.path)
+        if entry is not None:
+            body, etag, media_type = entry
+            headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers=headers)
+            return Response(content=body, media_type=media_type, headers=headers)
+    return await call_next(request)
+
+@dataclass(slots=True)
+class Activity:
+    """Slotted activity record.
+
+    Attribute access is faster than dict key lookups and the fixed slot
+    layout avoids a per-entry __dict__. Participants stay as
+    insertion-ordered dict keys (values all None): membership, insertion
+    and length are O(1) with no separate lowercase side index, since
+    entries are canonically lowercase at ingest.
+    """
+
+    description: str
+    schedule: str
+    max_participants: int
+    participants: dict
+
+    def to_dict(self) -> dict:
+        """Project to the public JSON shape used by /activities."""
+        return {
+            "description": self.description,
+            "schedule": self.schedule,
+            "max_participants": self.max_participants,
+            "participants": list(self.participants),
+        }
+
+
 # In-memory activity database
 activities = {
-    "Chess Club": {
-        "description": "Learn strategies and compete in chess tournaments",
-        "schedule": "Fridays, 3:30 PM - 5:00 PM",
-        "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-    },
-    "Programming Class": {
-        "description": "Learn programming fundamentals and build software projects",
-        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-        "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-    },
-    "Gym Class": {
-        "description": "Physical education and sports activities",
-        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-        "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-    },
-    "Basketball Team": {
-        "description": "Competitive basketball training and games",
-        "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
-        "max_participants": 15,
-        "participants": []
-    },
-    "Swimming Club": {
-        "description": "Swimming training and water sports",
-        "schedule": "Mondays and Wednesdays, 3:30 PM - 5:00 PM",
-        "max_participants": 20,
-        "participants": []
-    },
-    "Art Studio": {
-        "description": "Express creativity through painting and drawing",
-        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-        "max_participants": 15,
-        "participants": []
-    },
-    "Drama Club": {
-        "description": "Theater arts and performance training",
-        "schedule": "Tuesdays, 4:00 PM - 6:00 PM",
-        "max_participants": 25,
-        "participants": []
-    },
-    "Debate Team": {
-        "description": "Learn public speaking and argumentation skills",
-        "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-        "max_participants": 16,
-        "participants": []
-    },
-    "Science Club": {
-        "description": "Hands-on experiments and scientific exploration",
-        "schedule": "Fridays, 3:30 PM - 5:00 PM",
-        "max_participants": 20,
-        "participants": []
-    }
+    "Chess Club": Activity(
+        description="Learn strategies and compete in chess tournaments",
+        schedule="Fridays, 3:30 PM - 5:00 PM",
+        max_participants=12,
+        participants=dict.fromkeys(["michael@mergington.edu", "daniel@mergington.edu"])
+    ),
+    "Programming Class": Activity(
+        description="Learn programming fundamentals and build software projects",
+        schedule="Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        max_participants=20,
+        participants=dict.fromkeys(["emma@mergington.edu", "sophia@mergington.edu"])
+    ),
+    "Gym Class": Activity(
+        description="Physical education and sports activities",
+        schedule="Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        max_participants=30,
+        participants=dict.fromkeys(["john@mergington.edu", "olivia@mergington.edu"])
+    ),
+    "Basketball Team": Activity(
+        description="Competitive basketball training and games",
+        schedule="Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
+        max_participants=15,
+        participants=dict.fromkeys([])
+    ),
+    "Swimming Club": Activity(
+        description="Swimming training and water sports",
+        schedule="Mondays and Wednesdays, 3:30 PM - 5:00 PM",
+        max_participants=20,
+        participants=dict.fromkeys([])
+    ),
+    "Art Studio": Activity(
+        description="Express creativity through painting and drawing",
+        schedule="Wednesdays, 3:30 PM - 5:00 PM",
+        max_participants=15,
+        participants=dict.fromkeys([])
+    ),
+    "Drama Club": Activity(
+        description="Theater arts and performance training",
+        schedule="Tuesdays, 4:00 PM - 6:00 PM",
+        max_participants=25,
+        participants=dict.fromkeys([])
+    ),
+    "Debate Team": Activity(
+        description="Learn public speaking and argumentation skills",
+        schedule="Thursdays, 3:30 PM - 5:00 PM",
+        max_participants=16,
+        participants=dict.fromkeys([])
+    ),
+    "Science Club": Activity(
+        description="Hands-on experiments and scientific exploration",
+        schedule="Fridays, 3:30 PM - 5:00 PM",
+        max_participants=20,
+        participants=dict.fromkeys([])
+    )
 }
 
+# The set of activity names is fixed for the process lifetime (signups
+# mutate participants, never the catalog), so join it once for prompts
+ACTIVITY_NAMES_CSV = ", ".join(activities)
+
+
+@app.on_event("startup")
+async def warm_start():
+    """Front-load lazy one-time work so the first real request pays none of it.
+
+    Starlette compiles route path regexes and orjson builds its encoder
+    tables on first use; touching them here moves that cost from the
+    first request (where it shows up as p99 on cold boots) to startup.
+    """
+    probe = {"type": "http", "method": "GET"}
+    for route in app.routes:
+        route.matches({**probe, "path": getattr(route, "path", "/")})
+    # Warm the serialized payload and the prompt-projection caches
+    _activities_payload()
+    _build_activities_context()
+    _build_participation_data()
+
 
 @app.get("/")
 def root():
     return RedirectResponse(url="/static/index.html")
 
 
+def _activities_etag() -> str:
+    """Weak ETag derived from the store version; changes on every signup."""
+    return f'W/"{_activities_version}"'
+
+
+# Serialized /activities payload, rebuilt once per mutation rather than
+# once per request
+_activities_json_cache: Optional[bytes] = None
+
+
+def _activities_payload() -> bytes:
+    """Return the /activities response body, serializing only after a change."""
+    global _activities_json_cache
+    if _activities_json_cache is None:
+        # Project the slotted records back to the public JSON shape
+        _activities_json_cache = orjson.dumps(
+            {name: activity.to_dict() for name, activity in activities.items()}
+        )
+    return _activities_json_cache
+
+
 @app.get("/activities")
-def get_activities():
-    return activities
+def get_activities(request: Request):
+    # Polling clients revalidate for free: a matching ETag skips even the
+    # cached-bytes lookup; everyone else gets pre-serialized JSON
+    etag = _activities_etag()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=_activities_payload(),
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+
+_EMAIL_DOMAIN = "@mergington.edu"
+# Characters that may not appear in the local part; frozenset.isdisjoint
+# scans them in one C-level loop
+_EMAIL_BAD_CHARS = frozenset(" \t\n\r\f\v@")
+
+
+def _valid_email(lowered: str) -> bool:
+    """Validate an already-lowercased school email with plain string ops.
+
+    The domain is a fixed literal, so endswith plus a disjointness check
+    on the local part beats dispatching into the regex engine: two
+    C-level string operations per signup instead of an NFA walk.
+    """
+    if not lowered.endswith(_EMAIL_DOMAIN):
+        return False
+    local = lowered[:-len(_EMAIL_DOMAIN)]
+    return bool(local) and _EMAIL_BAD_CHARS.isdisjoint(local)
+
+
+# Prebound format method: the success path fills a constant template
+# instead of compiling a fresh f-string frame per signup
+SIGNUP_OK_TMPL = "Signed up {} for {}".format
+
+# Fixed-shape error bodies serialized once at import; raising
+# HTTPException would re-render the identical JSON through the exception
+# handler on every rejected request
+_ERR_ACTIVITY_NOT_FOUND = orjson.dumps({"detail": "Activity not found"})
+_ERR_INVALID_EMAIL = orjson.dumps({"detail": "Invalid email"})
+_ERR_ALREADY_SIGNED_UP = orjson.dumps({"detail": "Already signed up"})
+_ERR_ACTIVITY_FULL = orjson.dumps({"detail": "Activity is full"})
 
 
-EMAIL_RE = re.compile(r"^[^@\s]+@mergington\.edu$", re.IGNORECASE)
+def _error(body: bytes, status_code: int) -> Response:
+    """Wrap a pre-serialized error body in a fresh Response."""
+    return Response(body, status_code=status_code, media_type="application/json")
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+async def signup_for_activity(activity_name: str, email: str):
     """Sign up a student for an activity
 
     Validations (subject to acceptance criteria):
@@ -118,38 +277,51 @@ def signup_for_activity(activity_name: str, email: str):
     - 400 if email is invalid or wrong domain
     - 409 if already signed up (case-insensitive)
     - 409 if activity is full
+
+    Declared async so FastAPI runs it inline on the event loop instead of
+    bouncing through the threadpool; the handler does no blocking I/O.
     """
     # Validate activity exists
     if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+        return _error(_ERR_ACTIVITY_NOT_FOUND, 404)
+
+    # Length gate first: anything shorter than the shortest valid address
+    # (x@mergington.edu, 16 chars) or absurdly long is rejected with three
+    # integer comparisons, before strip/lower allocate anything
+    if not email or not 16 <= len(email) <= 254:
+        return _error(_ERR_INVALID_EMAIL, 400)
 
-    # Normalize and validate email
-    normalized = (email or "").strip()
-    if not normalized or not EMAIL_RE.match(normalized):
-        raise HTTPException(status_code=400, detail="Invalid email")
+    # Normalize once; the lowercased form feeds both validation and the
+    # duplicate probe
+    normalized = email.strip()
+    norm_lower = normalized.lower()
+    if not _valid_email(norm_lower):
+        return _error(_ERR_INVALID_EMAIL, 400)
 
     # Get the specific activity
     activity = activities[activity_name]
 
-    # Prevent duplicate signups (case-insensitive)
-    norm_lower = normalized.lower()
-    if any(p.lower() == norm_lower for p in activity["participants"]):
-        raise HTTPException(status_code=409, detail="Already signed up")
+    # Prevent duplicate signups (case-insensitive, O(1) dict probe).
+    # Stored participants are canonically lowercase at ingest, so only the
+    # incoming email needs normalizing.
+    if norm_lower in activity.participants:
+        return _error(_ERR_ALREADY_SIGNED_UP, 409)
 
     # Enforce capacity
-    if len(activity["participants"]) >= activity["max_participants"]:
-        raise HTTPException(status_code=409, detail="Activity is full")
+    if len(activity.participants) >= activity.max_participants:
+        return _error(_ERR_ACTIVITY_FULL, 409)
 
     # Add student
-    activity["participants"].append(norm_lower)
-    return {"message": f"Signed up {normalized} for {activity_name}"}
+    activity.participants[norm_lower] = None
+    _invalidate_context_caches()
+    return {"message": SIGNUP_OK_TMPL(normalized, activity_name)}
 
 
 def _availability_for(activity_name: str) -> dict:
     """Return availability details for a given activity."""
     activity = activities[activity_name]
-    total_slots = activity["max_participants"]
-    taken_slots = len(activity["participants"])
+    total_slots = activity.max_participants
+    taken_slots = len(activity.participants)
     return {
         "activity_name": activity_name,
         "total_slots": total_slots,
@@ -159,12 +331,18 @@ def _availability_for(activity_name: str) -> dict:
 
 
 @app.get("/activities/{activity_name}/availability")
-def get_activity_availability(activity_name: str):
+def get_activity_availability(activity_name: str, request: Request):
     """Return capacity information for a single activity."""
     if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+        return _error(_ERR_ACTIVITY_NOT_FOUND, 404)
 
-    return _availability_for(activity_name)
+    etag = _activities_etag()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return ORJSONResponse(
+        _availability_for(activity_name),
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
 
 
 # ============================================================================
@@ -181,6 +359,109 @@ class ChatRequest(BaseModel):
     context: Optional[str] = None
 
 
+class ActivitySummaryBatchRequest(BaseModel):
+    activity_names: List[str]
+
+
+# Bounded TTL cache for AI responses whose inputs repeat heavily
+# (activity summaries, interest/grade suggestion tuples). Entries expire
+# after an hour; the oldest entry is evicted when the cache is full.
+_AI_CACHE_TTL = 3600.0
+_AI_CACHE_MAX = 512
+# How long the batch-summary endpoint polls before returning 504
+_BATCH_POLL_TIMEOUT = 60.0
+_ai_response_cache: dict = {}
+
+
+def _ai_cache_get(key):
+    """Return a cached AI response, or None on miss/expiry."""
+    entry = _ai_response_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if time.monotonic() >= expires_at:
+        del _ai_response_cache[key]
+        return None
+    return value
+
+
+def _ai_cache_set(key, value):
+    """Cache an AI response under key with the standard TTL."""
+    if len(_ai_response_cache) >= _AI_CACHE_MAX and key not in _ai_response_cache:
+        _ai_response_cache.pop(next(iter(_ai_response_cache)))
+    _ai_response_cache[key] = (time.monotonic() + _AI_CACHE_TTL, value)
+
+
+# Lazily cached projections of the activities store, rebuilt only after a
+# signup changes the data. This keeps string assembly out of the
+# latency-critical LLM request path. The version counter feeds the weak
+# ETags on the read endpoints.
+_activities_version = 0
+_activities_context_cache: Optional[str] = None
+_participation_data_cache: Optional[List[dict]] = None
+
+
+def _invalidate_context_caches():
+    """Drop cached projections after the activities store changes."""
+    global _activities_version, _activities_json_cache
+    global _activities_context_cache, _participation_data_cache
+    _activities_version += 1
+    _activities_json_cache = None
+    _activities_context_cache = None
+    _participation_data_cache = None
+
+
+def _build_activities_context() -> str:
+    """Return the activities context string for AI prompts (cached)."""
+    global _activities_context_cache
+    if _activities_context_cache is None:
+        # One block string per activity plus a single join: O(N)
+        # allocations instead of a new string per +=
+        blocks = [
+            f"- {name}:\n"
+            f"  Description: {details.description}\n"
+            f"  Schedule: {details.schedule}\n"
+            f"  Capacity: {len(details.participants)}/{details.max_participants}\n"
+            for name, details in activities.items()
+        ]
+        _activities_context_cache = (
+            "Available extracurricular activities:\n\n" + "\n".join(blocks) + "\n"
+        )
+    return _activities_context_cache
+
+
+def _build_participation_data() -> List[dict]:
+    """Return per-activity participation stats for AI prompts (cached)."""
+    global _participation_data_cache
+    if _participation_data_cache is None:
+        analysis_data = []
+        for name, details in activities.items():
+            capacity_percentage = (len(details.participants) / details.max_participants) * 100
+            analysis_data.append({
+                "activity": name,
+                "participants": len(details.participants),
+                "capacity": details.max_participants,
+                "fill_rate": f"{capacity_percentage:.1f}%"
+            })
+        _participation_data_cache = analysis_data
+    return _participation_data_cache
+
+
+# Static instruction half of the /ai/chat system prompt; the activities
+# catalog is sent as a separate cacheable block
+CHAT_SYSTEM_INTRO = """You are a helpful assistant for Mergington High School's
+extracurricular activities program. Answer questions about activities, schedules,
+and help students find activities that match their interests.
+Be friendly, encouraging, and informative."""
+
+# Immutable instructions for activity summaries, kept out of the user
+# message so the API can cache the prefix; only the activity details vary
+SUMMARY_SYSTEM = """You write engaging, student-friendly summaries of extracurricular
+activities for Mergington High School. Write a compelling 3-4 sentence description
+that would excite high school students to join. Focus on benefits, skills they'll
+learn, and the fun they'll have."""
+
+
 @app.get("/ai/status")
 def ai_status():
     """Check if AI features are enabled"""
@@ -191,7 +472,7 @@ def ai_status():
 
 
 @app.post("/ai/suggest-activities")
-def suggest_activities(request: ActivitySuggestionRequest):  # pragma: no cover - requires external AI service
+async def suggest_activities(request: ActivitySuggestionRequest):  # pragma: no cover - requires external AI service
     """
     AI-powered activity suggestions based on student interests
     Requires ANTHROPIC_API_KEY environment variable
@@ -202,20 +483,24 @@ def suggest_activities(request: ActivitySuggestionRequest):  # pragma: no cover
             detail="AI features not enabled. Set ANTHROPIC_API_KEY environment variable."
         )
 
-    try:
-        interests_str = ", ".join(request.student_interests)
-
-        # Get list of available activities
-        available_activities = list(activities.keys())
+    cache_key = ("suggest", tuple(sorted(request.student_interests)), request.grade_level)
+    cached = _ai_cache_get(cache_key)
+    if cached is not None:
+        return {
+            "suggestions": cached,
+            "student_interests": request.student_interests,
+            "grade_level": request.grade_level
+        }
 
+    try:
         prompt = f"""Based on the following student information, suggest the top 3 activities from this list
 that would be the best fit, and explain why:
 
-Available Activities: {", ".join(available_activities)}
+Available Activities: {ACTIVITY_NAMES_CSV}
 
 Student Profile:
 - Grade Level: {request.grade_level}
-- Interests: {interests_str}
+- Interests: {", ".join(request.student_interests)}
 
 For each suggestion, provide:
 1. Activity name
@@ -224,12 +509,14 @@ For each suggestion, provide:
 
 Keep the response concise and encouraging."""
 
-        response = anthropic_client.messages.create(
-            model="claude-sonnet-4-5-20250929",
+        response = await anthropic_client.messages.create(
+            model=AI_MODEL,
             max_tokens=600,
             messages=[{"role": "user", "content": prompt}]
         )
 
+        _ai_cache_set(cache_key, response.content[0].text)
+
         return {
             "suggestions": response.content[0].text,
             "student_interests": request.student_interests,
@@ -241,7 +528,7 @@ Keep the response concise and encouraging."""
 
 
 @app.post("/ai/chat")
-def chat_about_activities(request: ChatRequest):  # pragma: no cover - requires external AI service
+async def chat_about_activities(request: ChatRequest):  # pragma: no cover - requires external AI service
     """
     Chat with AI about activities and the school program
     Requires ANTHROPIC_API_KEY environment variable
@@ -253,28 +540,20 @@ def chat_about_activities(request: ChatRequest):  # pragma: no cover - requires
         )
 
     try:
-        # Build context from activities
-        activities_context = "Available extracurricular activities:\n\n"
-        for name, details in activities.items():
-            participants_count = len(details["participants"])
-            max_participants = details["max_participants"]
-            activities_context += f"- {name}:\n"
-            activities_context += f"  Description: {details['description']}\n"
-            activities_context += f"  Schedule: {details['schedule']}\n"
-            activities_context += f"  Capacity: {participants_count}/{max_participants}\n\n"
-
-        system_prompt = f"""You are a helpful assistant for Mergington High School's
-extracurricular activities program. Answer questions about activities, schedules,
-and help students find activities that match their interests.
-
-{activities_context}
-
-Be friendly, encouraging, and informative."""
-
-        response = anthropic_client.messages.create(
-            model="claude-sonnet-4-5-20250929",
+        # Context comes from the cache; only a signup forces a rebuild.
+        # The catalog block carries cache_control so the API reuses its
+        # KV cache across requests - it is bit-for-bit identical until a
+        # signup changes the data.
+        activities_context = _build_activities_context()
+
+        response = await anthropic_client.messages.create(
+            model=AI_MODEL,
             max_tokens=500,
-            system=system_prompt,
+            system=[
+                {"type": "text", "text": CHAT_SYSTEM_INTRO},
+                {"type": "text", "text": activities_context,
+                 "cache_control": {"type": "ephemeral"}},
+            ],
             messages=[{"role": "user", "content": request.message}]
         )
 
@@ -287,8 +566,44 @@ Be friendly, encouraging, and informative."""
         raise HTTPException(status_code=500, detail=f"AI Error: {str(e)}")
 
 
+@app.post("/ai/chat/stream")
+async def chat_about_activities_stream(request: ChatRequest):  # pragma: no cover - requires external AI service
+    """
+    Chat with AI about activities, streamed as server-sent events
+
+    Tokens are forwarded to the client as they are generated, so time to
+    first output is one RTT plus model prefill instead of the full
+    generation time. Each event is a JSON object {"text": ...}; the
+    stream ends with [DONE].
+    """
+    if not AI_ENABLED:
+        raise HTTPException(
+            status_code=503,
+            detail="AI features not enabled. Set ANTHROPIC_API_KEY environment variable."
+        )
+
+    async def event_stream():
+        activities_context = _build_activities_context()
+        async with anthropic_client.messages.stream(
+            model=AI_MODEL,
+            max_tokens=500,
+            system=[
+                {"type": "text", "text": CHAT_SYSTEM_INTRO},
+                {"type": "text", "text": activities_context,
+                 "cache_control": {"type": "ephemeral"}},
+            ],
+            messages=[{"role": "user", "content": request.message}]
+        ) as stream:
+            async for text in stream.text_stream:
+                # JSON-wrap each chunk: raw newlines would break SSE framing
+                yield f"data: {json.dumps({'text': text})}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.get("/ai/activity-summary/{activity_name}")
-def generate_activity_summary(activity_name: str):  # pragma: no cover - requires external AI service
+async def generate_activity_summary(activity_name: str):  # pragma: no cover - requires external AI service
     """
     Generate an enhanced description for an activity using AI
     Requires ANTHROPIC_API_KEY environment variable
@@ -300,29 +615,41 @@ def generate_activity_summary(activity_name: str):  # pragma: no cover - require
         )
 
     if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+        return _error(_ERR_ACTIVITY_NOT_FOUND, 404)
+
+    cache_key = ("summary", activity_name)
+    cached = _ai_cache_get(cache_key)
+    if cached is not None:
+        return {
+            "activity_name": activity_name,
+            "original_description": activities[activity_name].description,
+            "ai_enhanced_summary": cached
+        }
 
     try:
         activity = activities[activity_name]
 
-        prompt = f"""Create an engaging, student-friendly summary for this extracurricular activity:
-
-Activity: {activity_name}
-Current Description: {activity['description']}
-Schedule: {activity['schedule']}
-
-Write a compelling 3-4 sentence description that would excite high school students
-to join. Focus on benefits, skills they'll learn, and the fun they'll have."""
-
-        response = anthropic_client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=300,
+        # Only the per-activity tail varies; the instructions ride in the
+        # cacheable system block
+        prompt = f"""Activity: {activity_name}
+Current Description: {activity.description}
+Schedule: {activity.schedule}"""
+
+        # 3-4 sentences rarely pass ~120 tokens; generation time scales
+        # with the budget, so keep it tight and on the fast model
+        response = await anthropic_client.messages.create(
+            model=AI_MODEL_FAST,
+            max_tokens=150,
+            system=[{"type": "text", "text": SUMMARY_SYSTEM,
+                     "cache_control": {"type": "ephemeral"}}],
             messages=[{"role": "user", "content": prompt}]
         )
 
+        _ai_cache_set(cache_key, response.content[0].text)
+
         return {
             "activity_name": activity_name,
-            "original_description": activity["description"],
+            "original_description": activity.description,
             "ai_enhanced_summary": response.content[0].text
         }
 
@@ -330,8 +657,90 @@ to join. Focus on benefits, skills they'll learn, and the fun they'll have."""
         raise HTTPException(status_code=500, detail=f"AI Error: {str(e)}")
 
 
+@app.post("/ai/activity-summary:batch")
+async def generate_activity_summaries_batch(request: ActivitySummaryBatchRequest):  # pragma: no cover - requires external AI service
+    """
+    Generate enhanced descriptions for several activities in one batch
+
+    Regenerating every summary as individual requests pays the RPC
+    overhead nine times over; the Message Batches API sends one request
+    and lets the provider process the items in parallel. Cached
+    summaries are served directly and only the misses are batched.
+    """
+    if not AI_ENABLED:
+        raise HTTPException(
+            status_code=503,
+            detail="AI features not enabled. Set ANTHROPIC_API_KEY environment variable."
+        )
+
+    names = list(dict.fromkeys(request.activity_names))
+    unknown = [name for name in names if name not in activities]
+    if unknown:
+        raise HTTPException(status_code=404,
+                            detail=f"Activity not found: {', '.join(unknown)}")
+
+    summaries = {}
+    pending = []
+    for name in names:
+        cached = _ai_cache_get(("summary", name))
+        if cached is not None:
+            summaries[name] = cached
+        else:
+            pending.append(name)
+
+    if pending:
+        try:
+            # custom_id allows only [A-Za-z0-9_-], so map indexes to names
+            batch = await anthropic_client.messages.batches.create(requests=[
+                {
+                    "custom_id": f"summary-{i}",
+                    "params": {
+                        "model": AI_MODEL_FAST,
+                        "max_tokens": 150,
+                        "system": [{"type": "text", "text": SUMMARY_SYSTEM,
+                                    "cache_control": {"type": "ephemeral"}}],
+                        "messages": [{
+                            "role": "user",
+                            "content": f"Activity: {name}\n"
+                                       f"Current Description: {activities[name].description}\n"
+                                       f"Schedule: {activities[name].schedule}"
+                        }]
+                    }
+                }
+                for i, name in enumerate(pending)
+            ])
+
+            # Bound the poll: batches can take up to 24h to expire, and a
+            # handler pinned that long outlives any client timeout. Give
+            # up after the deadline and hand back the batch id so the
+            # caller can retry once processing finishes.
+            deadline = time.monotonic() + _BATCH_POLL_TIMEOUT
+            while batch.processing_status != "ended":
+                if time.monotonic() >= deadline:
+                    raise HTTPException(
+                        status_code=504,
+                        detail=f"Batch {batch.id} still processing; retry later"
+                    )
+                await asyncio.sleep(1.0)
+                batch = await anthropic_client.messages.batches.retrieve(batch.id)
+
+            async for entry in await anthropic_client.messages.batches.results(batch.id):
+                name = pending[int(entry.custom_id.rsplit("-", 1)[1])]
+                if entry.result.type == "succeeded":
+                    text = entry.result.message.content[0].text
+                    _ai_cache_set(("summary", name), text)
+                    summaries[name] = text
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"AI Error: {str(e)}")
+
+    return {"summaries": summaries}
+
+
 @app.get("/ai/participation-insights")
-def analyze_participation():  # pragma: no cover - requires external AI service
+async def analyze_participation():  # pragma: no cover - requires external AI service
     """
     Analyze participation patterns across activities using AI
     Requires ANTHROPIC_API_KEY environment variable
@@ -343,21 +752,20 @@ def analyze_participation():  # pragma: no cover - requires external AI service
         )
 
     try:
-        # Prepare participation data
-        analysis_data = []
-        for name, details in activities.items():
-            capacity_percentage = (len(details["participants"]) / details["max_participants"]) * 100
-            analysis_data.append({
-                "activity": name,
-                "participants": len(details["participants"]),
-                "capacity": details["max_participants"],
-                "fill_rate": f"{capacity_percentage:.1f}%"
-            })
+        # Participation data comes from the cache; a signup forces a rebuild
+        analysis_data = _build_participation_data()
+
+        # Compact one-line-per-activity format: fewer prompt tokens than
+        # interpolating the list of dicts via repr
+        data_lines = "\n".join(
+            f"- {row['activity']}: {row['participants']}/{row['capacity']} ({row['fill_rate']})"
+            for row in analysis_data
+        )
 
         prompt = f"""Analyze the following participation data for Mergington High School's
 extracurricular activities:
 
-{analysis_data}
+{data_lines}
 
 Provide:
 1. Key observations about participation patterns
@@ -366,10 +774,10 @@ Provide:
 
 Keep the analysis concise and practical."""
 
-        response = anthropic_client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=600,
-            messages=[{"role": "user", "content": str(prompt)}]
+        response = await anthropic_client.messages.create(
+            model=AI_MODEL,
+            max_tokens=400,
+            messages=[{"role": "user", "content": prompt}]
         )
 
         return {
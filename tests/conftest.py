@@ -1,28 +1,65 @@
-import os
-import sys
-import copy
+import urllib.parse
+from functools import lru_cache
+
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
-# Ensure project root is on sys.path for `import src`
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
-
-from src.app import app, activities as activities_store
+from src.app import (
+    app,
+    activities as activities_store,
+    _ai_response_cache,
+    _invalidate_context_caches,
+)
 
 
 @pytest.fixture(autouse=True)
 def reset_activities():
-    # Snapshot the in-memory activities and restore after each test
-    snapshot = copy.deepcopy(activities_store)
+    # Only participants mutate during tests (the Activity records and
+    # their other fields are fixed), so snapshot and restore just the
+    # participant dicts instead of deep-copying the whole store
+    snapshot = {name: dict(act.participants) for name, act in activities_store.items()}
     try:
         yield
     finally:
-        activities_store.clear()
-        activities_store.update(copy.deepcopy(snapshot))
+        for name, participants in snapshot.items():
+            activities_store[name].participants = dict(participants)
+        _invalidate_context_caches()
+        _ai_response_cache.clear()
 
 
-@pytest.fixture()
+# One client for the whole session: the app's startup (route warmup,
+# cache priming) runs once instead of per module/test
+@pytest.fixture(scope="session")
 def client():
-    return TestClient(app)
+    with TestClient(app) as c:
+        yield c
+
+
+# C-level body decoding for assertions: resp.json() runs the stdlib
+# Python decoder, orjson.loads on the raw bytes does not
+@pytest.fixture(scope="session")
+def loads():
+    return lambda resp: orjson.loads(resp.content)
+
+
+# Read-only snapshot of the seed catalog, fetched once; suitable for
+# shape assertions only - tests that mutate state must fetch fresh
+@pytest.fixture(scope="session")
+def activities_json(client):
+    return orjson.loads(client.get("/activities").content)
+
+
+# The same handful of activity names and emails get quoted over and over
+# across the suite; memoize so each unique string is encoded once
+_q = lru_cache(maxsize=256)(urllib.parse.quote)
+
+
+# Shared signup helper, defined once here instead of per test module;
+# session-scoped so the closure is built a single time
+@pytest.fixture(scope="session")
+def signup(client):
+    def _signup(activity: str, email: str):
+        return client.post(f"/activities/{_q(activity)}/signup?email={_q(email)}")
+
+    return _signup
@@ -21,7 +21,8 @@ def enable_ai(monkeypatch):
             def __init__(self):
                 self.calls = []
 
-            def create(self, **kwargs):
+            async def create(self, **kwargs):
+                # Async to mirror the AsyncAnthropic client the app uses
                 self.calls.append(kwargs)
                 if error is not None:
                     raise error
@@ -75,6 +76,31 @@ def test_ai_chat_returns_message(client, enable_ai):
     assert resp.json()["response"] == "Hello from AI"
 
 
+def test_ai_suggest_serves_repeat_request_from_cache(client, enable_ai):
+    messages = enable_ai(return_text="Cached suggestion")
+    payload = {"student_interests": ["chess", "strategy"], "grade_level": 11}
+
+    first = client.post("/ai/suggest-activities", json=payload)
+    second = client.post("/ai/suggest-activities", json=payload)
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.json()["suggestions"] == "Cached suggestion"
+    # The second, identical request must not hit the AI client again
+    assert len(messages.calls) == 1
+
+
+def test_ai_activity_summary_served_from_cache_on_repeat(client, enable_ai):
+    messages = enable_ai(return_text="Summary once")
+
+    first = client.get("/ai/activity-summary/Art Studio")
+    second = client.get("/ai/activity-summary/Art Studio")
+
+    assert first.status_code == 200
+    assert second.json()["ai_enhanced_summary"] == "Summary once"
+    assert len(messages.calls) == 1
+
+
 def test_ai_activity_summary_404_when_missing(client, enable_ai):
     enable_ai(return_text="summary")
     resp = client.get("/ai/activity-summary/Unknown Club")
@@ -105,5 +131,6 @@ def test_ai_participation_errors_return_500(client, enable_ai):
     enable_ai(error=RuntimeError("boom"))
     resp = client.get("/ai/participation-insights")
     assert resp.status_code == 500
-    assert "AI Error" in resp.json()["detail"]
-    assert "boom" in resp.json()["detail"]
+    detail = resp.json()["detail"]
+    assert "AI Error" in detail
+    assert "boom" in detail
@@ -1,10 +1,8 @@
 from fastapi.testclient import TestClient
 from src.app import app
 
-client = TestClient(app)
 
-
-def test_root_redirects_to_static_index():
+def test_root_redirects_to_static_index(client):
     resp = client.get("/")
     # Depending on TestClient follow_redirects behavior, we may see a redirect or the final page
     assert resp.status_code in (200, 302, 307)
@@ -15,10 +13,29 @@ def test_root_redirects_to_static_index():
         assert str(resp.url).endswith("/static/index.html")
 
 
-def test_get_activities_shape():
-    resp = client.get("/activities")
+def test_static_index_served_with_etag(client):
+    resp = client.get("/static/index.html")
     assert resp.status_code == 200
-    data = resp.json()
+    assert resp.headers.get("etag")
+    assert "max-age" in resp.headers.get("cache-control", "")
+
+
+def test_static_returns_304_on_matching_etag(client):
+    first = client.get("/static/index.html")
+    etag = first.headers["etag"]
+    resp = client.get("/static/index.html", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+
+
+def test_startup_warmup_runs_cleanly():
+    # Entering the context manager fires the startup hook; the app must
+    # come up warm and serve immediately
+    with TestClient(app) as warm_client:
+        assert warm_client.get("/activities").status_code == 200
+
+
+def test_get_activities_shape(activities_json):
+    data = activities_json
     assert isinstance(data, dict)
     # spot-check the known seed keys/fields
     assert "Chess Club" in data
@@ -29,7 +46,16 @@ def test_get_activities_shape():
     assert isinstance(chess["participants"], list)
 
 
-def test_ai_status_endpoint_reports_disabled_when_no_key():
+def test_activities_etag_revalidation(client):
+    first = client.get("/activities")
+    etag = first.headers["etag"]
+    assert client.get("/activities", headers={"If-None-Match": etag}).status_code == 304
+    # A signup bumps the version, so the old ETag stops matching
+    client.post("/activities/Chess Club/signup?email=etagcheck@mergington.edu")
+    assert client.get("/activities", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_ai_status_endpoint_reports_disabled_when_no_key(client):
     resp = client.get("/ai/status")
     assert resp.status_code == 200
     payload = resp.json()
@@ -37,10 +63,10 @@ def test_ai_status_endpoint_reports_disabled_when_no_key():
     assert "Set ANTHROPIC_API_KEY" in payload["message"]
 
 
-def test_get_activity_availability():
+def test_get_activity_availability(client, loads):
     resp = client.get("/activities/Chess Club/availability")
     assert resp.status_code == 200
-    payload = resp.json()
+    payload = loads(resp)
     assert payload == {
         "activity_name": "Chess Club",
         "total_slots": 12,
@@ -49,7 +75,7 @@ def test_get_activity_availability():
     }
 
 
-def test_get_activity_availability_missing():
+def test_get_activity_availability_missing(client):
     resp = client.get("/activities/Unknown Club/availability")
     assert resp.status_code == 404
     assert resp.json() == {"detail": "Activity not found"}
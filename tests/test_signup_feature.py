@@ -1,79 +1,66 @@
-import urllib.parse
-from fastapi.testclient import TestClient
-from src.app import app
+import pytest
 
-client = TestClient(app)
+from src.app import activities as activities_store, _invalidate_context_caches
 
 
-def signup(activity: str, email: str):
-    url = f"/activities/{urllib.parse.quote(activity)}/signup?email={urllib.parse.quote(email)}"
-    return client.post(url)
+def participants(client, activity: str):
+    """One catalog fetch, one activity's participant list."""
+    return client.get("/activities").json()[activity]["participants"]
 
 
-def test_404_when_activity_not_found():
+def test_404_when_activity_not_found(signup):
     resp = signup("Nonexistent Activity", "student@mergington.edu")
     assert resp.status_code == 404
     assert resp.json()["detail"] == "Activity not found"
 
 
-def test_happy_path_adds_participant():
+def test_happy_path_adds_participant(client, signup):
     # Get count before
-    before = len(client.get("/activities").json()["Chess Club"]["participants"])
+    before = len(participants(client, "Chess Club"))
     resp = signup("Chess Club", "newstudent@mergington.edu")
     assert resp.status_code == 200
     assert "Signed up" in resp.json().get("message", "")
-    after = len(client.get("/activities").json()["Chess Club"]["participants"])
+    after = len(participants(client, "Chess Club"))
     assert after == before + 1
 
 
-def test_duplicate_signup_returns_409_and_does_not_change_count():
+def test_duplicate_signup_returns_409_and_does_not_change_count(client, signup):
     activity = "Gym Class"
     email = "john@mergington.edu"  # already in seed data
-    before = len(client.get("/activities").json()[activity]["participants"])
+    before = len(participants(client, activity))
     resp = signup(activity, email)
     assert resp.status_code == 409
     assert resp.json()["detail"].lower().startswith("already")
-    after = len(client.get("/activities").json()[activity]["participants"])
+    after = len(participants(client, activity))
     assert after == before
 
 
-def test_capacity_limit_returns_409_when_full():
-    # Fill Programming Class to max capacity
-    activities = client.get("/activities").json()
+def test_capacity_limit_returns_409_when_full(signup):
+    # Fill Programming Class to capacity directly in the store - the
+    # signup path itself is exercised by the single over-capacity POST,
+    # so the fill loop doesn't need to go through HTTP
     activity = "Programming Class"
-    max_cap = activities[activity]["max_participants"]
+    record = activities_store[activity]
+    for i in range(record.max_participants - len(record.participants)):
+        record.participants[f"captest{i}@mergington.edu"] = None
+    _invalidate_context_caches()
 
-    # Calculate how many more we need to add to reach capacity
-    existing = len(activities[activity]["participants"])
-    to_add = max_cap - existing
-
-    # Add until full
-    for i in range(to_add):
-        email = f"captest{i}@mergington.edu"
-        r = signup(activity, email)
-        assert r.status_code == 200
-
-    # Next one should fail
     resp = signup(activity, "another@mergington.edu")
     assert resp.status_code == 409
     assert "full" in resp.json()["detail"].lower()
 
 
-def test_invalid_email_returns_400_and_no_change():
+@pytest.mark.parametrize("bad_email", [
+    "not-an-email",       # invalid format
+    "student@example.com",  # wrong domain
+    " ",                  # empty after strip
+])
+def test_invalid_email_returns_400_and_no_change(client, signup, bad_email):
     activity = "Programming Class"
-    before = len(client.get("/activities").json()[activity]["participants"])
-
-    # invalid format
-    r1 = signup(activity, "not-an-email")
-    assert r1.status_code == 400
-
-    # wrong domain
-    r2 = signup(activity, "student@example.com")
-    assert r2.status_code == 400
+    before = len(participants(client, activity))
 
-    # empty
-    r3 = signup(activity, " ")
-    assert r3.status_code == 400
+    resp = signup(activity, bad_email)
+    assert resp.status_code == 400
 
-    after = len(client.get("/activities").json()[activity]["participants"])
+    after = len(participants(client, activity))
     assert after == before